@@ -5,8 +5,12 @@ This module provides high-quality, local implementation of the workflow tools.
 It creates specific tool registries for each agent to ensure strict Separation of Concerns.
 """
 
+import ast
+import functools
+import json
 import os
 import logging
+import re
 from datetime import datetime
 from omnicoreagent import ToolRegistry
 
@@ -38,11 +42,16 @@ def ensure_string(text: str | list) -> str:
     return str(text)
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> str:
+    # Only the first call for a path has to create it; later calls skip makedirs
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 def get_output_dir() -> str:
     """Returns the absolute path to the outputs directory."""
-    output_dir = os.path.join(os.getcwd(), "outputs")
-    os.makedirs(output_dir, exist_ok=True)
-    return output_dir
+    return _ensure_dir(os.path.join(os.getcwd(), "outputs"))
 
 
 def create_chart_tool() -> ToolRegistry:
@@ -858,8 +867,6 @@ def create_report_tool() -> ToolRegistry:
         # Comprehensive markdown to HTML conversion
         def to_html(text: str) -> str:
             """Convert markdown to HTML with full syntax support."""
-            import re
-
             # First, try the markdown library for best results
             try:
                 import markdown as md_lib
@@ -1005,9 +1012,6 @@ def create_report_tool() -> ToolRegistry:
             # Build sections HTML if provided
             sections_html = ""
             if sections:
-                import json
-                import ast
-
                 if isinstance(sections, str):
                     try:
                         sections = json.loads(sections)
@@ -1018,13 +1022,15 @@ def create_report_tool() -> ToolRegistry:
                             sections = {}
 
                 if isinstance(sections, dict):
-                    for title, sec_content in sections.items():
-                        sections_html += f"""
+                    sections_html = "".join(
+                        f"""
                         <section class="report-section">
                             <h2>{title}</h2>
                             {to_html(ensure_string(sec_content))}
                         </section>
                         """
+                        for title, sec_content in sections.items()
+                    )
 
             # Professional HTML template
             template = f"""<!DOCTYPE html>
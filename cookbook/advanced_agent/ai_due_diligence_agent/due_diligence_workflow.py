@@ -65,6 +65,10 @@ class Colors:
     RESET = "\033[0m"
 
 
+# Icons for generated files, keyed by extension; anything else is a folder icon
+FILE_ICONS = {".html": "📄", ".png": "🖼️ "}
+
+
 def print_header():
     """Print the application header."""
     print(f"""
@@ -101,20 +105,16 @@ def print_summary(company: str, outputs: dict, elapsed: float):
 """)
     output_dir = os.path.join(os.getcwd(), "outputs")
     if os.path.exists(output_dir):
-        files = sorted(
-            os.listdir(output_dir),
-            key=lambda x: os.path.getmtime(os.path.join(output_dir, x)),
-            reverse=True,
-        )[:5]
-        for f in files:
-            filepath = os.path.join(output_dir, f)
-            size = os.path.getsize(filepath)
-            if f.endswith(".html"):
-                icon = "📄"
-            elif f.endswith(".png"):
-                icon = "🖼️ "
-            else:
-                icon = "📁"
+        # One directory read and one stat per file; mtime and size come from it
+        with os.scandir(output_dir) as it:
+            files = sorted(
+                ((entry.name, entry.stat()) for entry in it),
+                key=lambda item: item[1].st_mtime,
+                reverse=True,
+            )[:5]
+        for f, stat in files:
+            size = stat.st_size
+            icon = FILE_ICONS.get(os.path.splitext(f)[1], "📁")
             print(f"  {icon} {Colors.CYAN}{f}{Colors.RESET} ({size:,} bytes)")
 
     print(f"\n{Colors.DIM}Output directory: {output_dir}{Colors.RESET}\n")
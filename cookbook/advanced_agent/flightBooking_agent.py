@@ -47,8 +47,13 @@ def create_crm(path: str = CRM_FILE) -> None:
             },
         ]
     }
+    save_crm(sample, path)
+
+
+def save_crm(data: dict, path: str = CRM_FILE) -> None:
+    """Write the CRM back to disk in compact form; tools rewrite it on every change."""
     with open(path, "w") as f:
-        json.dump(sample, f, indent=2)
+        json.dump(data, f, separators=(",", ":"))
 
 
 # ------------------ Tool Registry ------------------ #
@@ -138,8 +143,7 @@ def book_flight(user_id: str, flight_id: str) -> dict:
     booking = {"booking_id": booking_id, "flight": flight_id, "status": "confirmed"}
     user.setdefault("bookings", []).append(booking)
 
-    with open(CRM_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    save_crm(data)
 
     return {
         "status": "success",
@@ -181,8 +185,7 @@ def cancel_booking(user_id: str, booking_id: str) -> dict:
 
     booking["status"] = "canceled"
 
-    with open(CRM_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    save_crm(data)
 
     return {
         "status": "success",
@@ -12,12 +12,21 @@ This example demonstrates EVERY capability of the BackgroundAgentManager:
 """
 
 import asyncio
+import itertools
 import os
 import random
 import time
 import logging
 from datetime import datetime, timezone
 
+# Try importing uvloop (faster event loop; no Windows build)
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Configure structured logging
 logging.basicConfig(
     level=logging.INFO,
@@ -35,13 +44,17 @@ from omnicoreagent import (
 
 # --- Tools ---
 
+# Mock load readings are drawn in one batch at import; the monitor agent polls
+# system_check every second or two and just steps through them
+_LOAD_READINGS = itertools.cycle(random.choices(range(1, 101), k=4096))
+
 async def create_tool_registry() -> ToolRegistry:
     registry = ToolRegistry()
 
     @registry.register_tool("system_check")
     def system_check(scope: str = "basic") -> str:
         """Simulate checking system stats."""
-        val = random.randint(1, 100)
+        val = next(_LOAD_READINGS)
         return f"System ({scope}) OK: {val}%"
 
     @registry.register_tool("generate_report")
@@ -179,4 +192,7 @@ async def main():
         await manager.shutdown()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -13,7 +13,7 @@ Run:
 """
 
 import asyncio
-
+import time
 
 from omnicoreagent import OmniCoreAgent, ToolRegistry
 
@@ -52,8 +52,6 @@ def create_tools() -> ToolRegistry:
     @tools.register_tool("get_time")
     def get_time() -> str:
         """Get the current time."""
-        import time
-
         try:
             return {
                 "status": "success",
@@ -4,6 +4,7 @@ import signal
 import sys
 import json
 import asyncio
+import threading
 
 # --------------------------------------------------------------
 # 3. Rich UI (optional)
@@ -58,11 +59,69 @@ A secure, AI-powered assistant for DevOps tasks, built for production-grade work
 
 """
 
+HELP_TEXT = """
+# OmniDevOpsCopilot — Full Help Guide
+
+## Natural Language Queries
+> Ask anything in plain English:
+docker ps
+kubectl get pods --all-namespaces
+grep -i "error" /var/log/app.log
+The AI will safely execute and respond.
+
+---
+
+## Core Commands
+| Command | Description |
+|--------|-------------|
+| `/history` | Show full conversation history |
+| `/clear` | Clear current session history |
+| `/tools` | List all available tools |
+| `/events` | View event log for current session |
+| `/store_info` | Show memory & event store status |
+| `/switch_store [redis\\|in_memory]` | Switch backend storage |
+| `/metrics` | Show live Prometheus metrics |
+| `/health` | Run health checks |
+| `/audit` | View last 50 audit log entries |
+| `/exit` | Quit the CLI |
+
+---
+
+
+Observability
+
+Logs: All background tasks are logged
+Metrics: copilot_background_* in Prometheus
+Traces: Full trace in Jaeger (if enabled)
+
+
+Powered by OmniCoreAgent Framework
+https://github.com/Abiorh001/omnicoreagent
+"""
+
 
 class DevopsCopilotCli:
+    __slots__ = ("console", "devops_copilot", "commands")
+
     def __init__(self) -> None:
         self.console = Console() if RICH_AVAILABLE else None
         self.devops_copilot = DevOpsCopilotRunner()
+        # Slash commands resolve with a single dict lookup; each handler takes
+        # the text after the command and returns True to end the session
+        self.commands = {
+            "/metrics": self.handle_metrics,
+            "/health": self.handle_health,
+            "/audit": self.handle_audit,
+            "/exit": self.handle_exit,
+            "/quit": self.handle_exit,
+            "/history": self.handle_history,
+            "/clear": self.handle_clear,
+            "/tools": self.handle_tools,
+            "/events": self.handle_events,
+            "/switch_store": self.handle_switch_store,
+            "/store_info": self.handle_store_info,
+            "/help": self.handle_help,
+        }
 
     def print_styled(self, content: str, style: str = ""):
         if RICH_AVAILABLE:
@@ -98,14 +157,7 @@ class DevopsCopilotCli:
 
         while True:
             try:
-                user_input = (
-                    Prompt.ask(
-                        "\n[bold blue][[/bold blue][bold green]OmniDevOpsCopilot[/bold green][bold blue]][/bold blue]"
-                    )
-                    if RICH_AVAILABLE
-                    else input("\n[OmniDevOpsCopilot] ")
-                )
-                user_input = user_input.strip()
+                user_input = (await self.read_input()).strip()
             except (EOFError, KeyboardInterrupt):
                 self.print_styled("Goodbye!", "info")
                 break
@@ -113,132 +165,124 @@ class DevopsCopilotCli:
             if not user_input:
                 continue
 
-            if user_input == "/metrics":
-                self.print_styled(metrics.export(), "info")
-                continue
-
-            if user_input == "/health":
-                health_status = health.run()
-                self.print_styled(json.dumps(health_status, indent=2), "info")
-                metrics.set_health(health_status.get("overall", False))
-                continue
-
-            if user_input == "/audit":
-                try:
-                    with open(self.devops_copilot.cfg.security.audit_log_file) as f:
-                        lines = f.readlines()
-                        self.print_styled("".join(lines[-50:]), "info")
-                except FileNotFoundError:
-                    self.print_styled("No audit log yet.", "info")
-                continue
-
-            if user_input in {"/exit", "/quit"}:
-                self.print_styled("Goodbye!", "info")
-                log.info("User exited")
-                break
-
-            if user_input == "/history":
-                history = await self.devops_copilot.agent.get_session_history(
-                    self.devops_copilot.session_id
-                )
-                self.print_styled(str(history), "info")
-                continue
-
-            if user_input == "/clear":
-                await self.devops_copilot.agent.clear_session_history(
-                    self.devops_copilot.session_id
-                )
-                self.print_styled("History cleared.", "info")
+            command, _, args = user_input.partition(" ")
+            handler = self.commands.get(command)
+            if handler:
+                if await handler(args.strip()):
+                    break
                 continue
 
-            if user_input == "/tools":
-                tools = await self.devops_copilot.agent.list_all_available_tools()
-                self.print_styled(str(tools), "info")
-                continue
+            await self.handle_chat(user_input)
 
-            if user_input == "/events":
-                events = await self.devops_copilot.agent.get_events(
-                    self.devops_copilot.session_id
-                )
-                self.print_styled(str(events), "info")
-                continue
+    def prompt(self) -> str:
+        if RICH_AVAILABLE:
+            return Prompt.ask(
+                "\n[bold blue][[/bold blue][bold green]OmniDevOpsCopilot[/bold green][bold blue]][/bold blue]"
+            )
+        return input("\n[OmniDevOpsCopilot] ")
 
-            if user_input.startswith("/switch_store"):
-                parts = user_input.split()
-                if len(parts) != 2 or parts[1] not in {"redis", "in_memory"}:
-                    self.print_styled("Usage: /switch_store [redis|in_memory]", "error")
-                    continue
-                store_type = parts[1]
-                try:
-                    self.devops_copilot.agent.switch_memory_store(store_type)
-                    self.devops_copilot.agent.switch_event_store(store_type)
-                    self.print_styled(f"Switched to {store_type}", "info")
-                    log.info(f"Switched store to {store_type}")
-                except Exception as e:
-                    self.print_styled(f"Switch failed: {e}", "error")
-                continue
+    async def read_input(self) -> str:
+        """Wait for the next line without blocking the event loop.
 
-            if user_input == "/store_info":
-                info = {
-                    "memory_store": self.devops_copilot.agent.get_memory_store_type(),
-                    "event_store": self.devops_copilot.agent.get_event_store_type(),
-                    "event_store_available": self.devops_copilot.agent.is_event_store_available(),
-                }
-                self.print_styled(json.dumps(info, indent=2), "info")
-                continue
+        The prompt runs on a daemon thread so agent work and event delivery
+        keep going while the user types, and a pending prompt never holds up
+        interpreter exit.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
 
-            if user_input == "/help":
-                help_text = """
-                # OmniDevOpsCopilot — Full Help Guide
-
-                ## Natural Language Queries
-                > Ask anything in plain English:
-                docker ps
-                kubectl get pods --all-namespaces
-                grep -i "error" /var/log/app.log
-                The AI will safely execute and respond.
-
-                ---
-
-                ## Core Commands
-                | Command | Description |
-                |--------|-------------|
-                | `/history` | Show full conversation history |
-                | `/clear` | Clear current session history |
-                | `/tools` | List all available tools |
-                | `/events` | View event log for current session |
-                | `/store_info` | Show memory & event store status |
-                | `/switch_store [redis\|in_memory]` | Switch backend storage |
-                | `/metrics` | Show live Prometheus metrics |
-                | `/health` | Run health checks |
-                | `/audit` | View last 50 audit log entries |
-                | `/exit` | Quit the CLI |
-
-                ---
-
-                
-                Observability
-
-                Logs: All background tasks are logged
-                Metrics: copilot_background_* in Prometheus
-                Traces: Full trace in Jaeger (if enabled)
-
-
-                Powered by OmniCoreAgent Framework
-                https://github.com/Abiorh001/omnicoreagent
-                """
-                self.print_styled(help_text, "info")
-                continue
+        def deliver(setter, value):
+            if not future.done():
+                setter(value)
 
-            self.print_styled(user_input, "user")
-            response = await self.devops_copilot.handle_chat(
-                query=user_input, session_id=self.devops_copilot.session_id
+        def read():
+            try:
+                line = self.prompt()
+            except Exception as exc:
+                loop.call_soon_threadsafe(deliver, future.set_exception, exc)
+            else:
+                loop.call_soon_threadsafe(deliver, future.set_result, line)
+
+        threading.Thread(target=read, daemon=True).start()
+        return await future
+
+    async def handle_chat(self, user_input: str):
+        self.print_styled(user_input, "user")
+        response = await self.devops_copilot.handle_chat(
+            query=user_input, session_id=self.devops_copilot.session_id
+        )
+        if response:
+            self.print_styled(response.get("response", ""), "agent")
+            log.info(
+                f"Query: {user_input[:50]}... → Response length: {len(response['response'])}"
             )
-            if response:
-                self.print_styled(response.get("response", ""), "agent")
-                log.info(
-                    f"Query: {user_input[:50]}... → Response length: {len(response['response'])}"
-                )
+
+    async def handle_metrics(self, args: str):
+        self.print_styled(metrics.export(), "info")
+
+    async def handle_health(self, args: str):
+        health_status = health.run()
+        self.print_styled(json.dumps(health_status, indent=2), "info")
+        metrics.set_health(health_status.get("overall", False))
+
+    async def handle_audit(self, args: str):
+        try:
+            with open(self.devops_copilot.cfg.security.audit_log_file) as f:
+                lines = f.readlines()
+                self.print_styled("".join(lines[-50:]), "info")
+        except FileNotFoundError:
+            self.print_styled("No audit log yet.", "info")
+
+    async def handle_exit(self, args: str) -> bool:
+        self.print_styled("Goodbye!", "info")
+        log.info("User exited")
+        return True
+
+    async def handle_history(self, args: str):
+        history = await self.devops_copilot.agent.get_session_history(
+            self.devops_copilot.session_id
+        )
+        self.print_styled(str(history), "info")
+
+    async def handle_clear(self, args: str):
+        await self.devops_copilot.agent.clear_session_history(
+            self.devops_copilot.session_id
+        )
+        self.print_styled("History cleared.", "info")
+
+    async def handle_tools(self, args: str):
+        tools = await self.devops_copilot.agent.list_all_available_tools()
+        self.print_styled(str(tools), "info")
+
+    async def handle_events(self, args: str):
+        events = await self.devops_copilot.agent.get_events(
+            self.devops_copilot.session_id
+        )
+        self.print_styled(str(events), "info")
+
+    async def handle_switch_store(self, args: str):
+        if args not in {"redis", "in_memory"}:
+            self.print_styled("Usage: /switch_store [redis|in_memory]", "error")
+            return
+        try:
+            await self.devops_copilot.agent.switch_memory_store(args)
+            await self.devops_copilot.agent.switch_event_store(args)
+            self.print_styled(f"Switched to {args}", "info")
+            log.info(f"Switched store to {args}")
+        except Exception as e:
+            self.print_styled(f"Switch failed: {e}", "error")
+
+    async def handle_store_info(self, args: str):
+        agent = self.devops_copilot.agent
+        info = {
+            "memory_store": await agent.get_memory_store_type(),
+            "event_store": await agent.get_event_store_type(),
+            "event_store_available": await agent.is_event_store_available(),
+        }
+        self.print_styled(json.dumps(info, indent=2), "info")
+
+    async def handle_help(self, args: str):
+        self.print_styled(HELP_TEXT, "info")
 
     async def shutdown(self):
         """Cleanup resources and end session"""
@@ -2,7 +2,8 @@ import json
 from pathlib import Path
 from datetime import datetime, timezone
 import time
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import functools
 import re
 from omnicoreagent import ToolRegistry, MemoryRouter, OmniCoreAgent, EventRouter
 from agents.system_prompts import evidence_agent_prompt
@@ -13,9 +14,34 @@ local_tools = ToolRegistry()
 EVIDENCE_MD_PATH = Path("agents/data/plan_rules.md")
 
 
+def load_evidence_sections() -> Optional[Tuple[str, Dict[str, str]]]:
+    """Return (content, {plan_id: section}) for plan_rules.md, or None if missing."""
+    # Checked outside the cache so a miss (e.g. from another working
+    # directory) is retried on the next call instead of being remembered
+    if not EVIDENCE_MD_PATH.exists():
+        return None
+    return _read_evidence_sections()
+
+
+@functools.lru_cache(maxsize=1)
+def _read_evidence_sections() -> Tuple[str, Dict[str, str]]:
+    """Read plan_rules.md once per process; return (content, {plan_id: section})."""
+    content = EVIDENCE_MD_PATH.read_text(encoding="utf-8")
+
+    plan_sections = re.split(r"^##\s+(PLAN_[A-Z0-9]+):", content, flags=re.MULTILINE)[
+        1:
+    ]
+
+    sections = {}
+    for i in range(0, len(plan_sections), 2):
+        sections.setdefault(plan_sections[i].strip(), plan_sections[i + 1])
+    return content, sections
+
+
 def parse_evidence_snippets(plan_id: str, rule_ids: List[str]) -> List[Dict[str, Any]]:
     """Parse plan_rules.md and extract snippets for given plan + rules."""
-    if not EVIDENCE_MD_PATH.exists():
+    loaded = load_evidence_sections()
+    if loaded is None:
         return [
             {
                 "source_id": "MISSING_EVIDENCE_FILE",
@@ -25,19 +51,8 @@ def parse_evidence_snippets(plan_id: str, rule_ids: List[str]) -> List[Dict[str,
             }
         ]
 
-    content = EVIDENCE_MD_PATH.read_text(encoding="utf-8")
-
-    plan_sections = re.split(r"^##\s+(PLAN_[A-Z0-9]+):", content, flags=re.MULTILINE)[
-        1:
-    ]
-
-    plan_content = ""
-    for i in range(0, len(plan_sections), 2):
-        pid = plan_sections[i].strip()
-        text = plan_sections[i + 1]
-        if pid == plan_id:
-            plan_content = text
-            break
+    content, sections = loaded
+    plan_content = sections.get(plan_id, "")
 
     items = []
     for rule_id in rule_ids:
@@ -13,6 +13,24 @@ local_tools = ToolRegistry()
 RULES_PATH = Path("agents/data/plan_rules.json")
 
 
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def utc_timestamp() -> str:
+    """Return the current UTC time as ISO-8601, formatted at most once per second."""
+    global _last_ts_sec, _last_ts_str
+    now_s = int(time.time())
+    if now_s != _last_ts_sec:
+        _last_ts_str = (
+            datetime.fromtimestamp(now_s, tz=timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z")
+        )
+        _last_ts_sec = now_s
+    return _last_ts_str
+
+
 def load_plan_rules() -> Dict[str, Any]:
     """Load plan rules from disk; return empty structure if missing."""
     if RULES_PATH.exists():
@@ -53,7 +71,7 @@ async def rule_violation_logger(
     recommended_recovery: float = 0.0,
 ) -> dict:
     """Store or log a single rule violation for later audit synthesis."""
-    timestamp = datetime.now(timezone.utc).isoformat()
+    timestamp = utc_timestamp()
     violation = {
         "claim_id": claim_id,
         "violation_id": violation_id,
@@ -103,7 +121,7 @@ async def check_claim_against_rules(claim: Dict[str, Any]) -> Dict[str, Any]:
             "plan_id": plan_id,
             "plan_config": plan_config,
             "global_rules": global_rules,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": utc_timestamp(),
         },
     }
 
@@ -4,8 +4,14 @@ from agents.audit_synth_agent import AuditSynthAgent
 from agents.appeals_agent import AppealAgent
 import asyncio
 import xml.etree.ElementTree as ET
-import json
-from datetime import datetime
+
+# Try importing uvloop (faster event loop; no Windows build)
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
 
 
 print(r"""
@@ -59,22 +65,28 @@ def extract_violations_for_evidence(rule_checker_response: str, original_claim:
     try:
         if not rule_checker_response.strip().startswith("<"):
             raise ValueError("Invalid XML response")
-        root = ET.fromstring(f"<root>{rule_checker_response}</root>")
+        # Feed the synthetic root around the response instead of building a wrapped copy
+        parser = ET.XMLParser()
+        parser.feed("<root>")
+        parser.feed(rule_checker_response)
+        parser.feed("</root>")
+        root = parser.close()
         violations_elem = root.find("violations") or root
-        rule_ids, claim_id = [], None
+        # dict keys give O(1) membership while keeping first-seen order
+        seen_rule_ids, claim_id = {}, None
         for violation in violations_elem.findall("violation"):
             rule_id = violation.findtext("rule_id")
-            if rule_id and rule_id not in rule_ids:
-                rule_ids.append(rule_id)
+            if rule_id:
+                seen_rule_ids[rule_id] = None
             if claim_id is None:
                 claim_id = violation.findtext("claim_id")
         return (
             None
-            if not rule_ids
+            if not seen_rule_ids
             else {
                 "claim_id": claim_id or original_claim["claim_id"],
                 "plan_id": original_claim["plan_id"],
-                "rule_ids": rule_ids,
+                "rule_ids": list(seen_rule_ids),
             }
         )
     except ET.ParseError as e:
@@ -228,48 +240,60 @@ async def run_single_test(test_case, session_id, agents):
 
 
 async def main():
+    # Only needed for the audit log; keep them off the import path
+    import json
+    from datetime import datetime, timezone
+
     agents = (RuleCheckerAgent(), EvidenceAgent(), AuditSynthAgent(), AppealAgent())
 
     # Initialize all agents
     for agent in agents:
         await agent.initialize_mcp_servers()
 
-    all_results = []
-    try:
-        for i, test_case in enumerate(TEST_CASES, 1):
-            print(f"\n{'=' * 80}")
-            print(f"🧪 RUNNING TEST CASE {i}: {test_case['name']}")
-            print(f"{'=' * 80}")
-
-            session_id = f"test_{i}_{test_case['name']}"
-            result = await run_single_test(test_case, session_id, agents)
-            result["test_name"] = test_case["name"]
-            all_results.append(result)
-
-            print(f"\n✅ Test {i} Appeal Result:")
-            print(result["appeal_output"])
-
-    finally:
-        # Cleanup
-        for agent in agents:
-            await agent.cleanup_mcp_servers()
-
-    log_data = {
-        "generated_at": datetime.utcnow().isoformat() + "Z",
-        "framework": "OmnicoreAgent",
-        "project": "OmniAudit for Avelis",
-        "test_cases": all_results,
-    }
-
-    with open("demo_audit_log.json", "w") as f:
-        json.dump(log_data, f, indent=2)
+    # One JSON line per completed test keeps memory bounded and persists
+    # partial results if a later test case crashes. The 1 MiB buffer lets
+    # each test's payload reach disk in a single flush.
+    with open(
+        "demo_audit_log.jsonl", "w", encoding="utf-8", buffering=1 << 20
+    ) as log_f:
+        header = {
+            "generated_at": datetime.now(timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z"),
+            "framework": "OmnicoreAgent",
+            "project": "OmniAudit for Avelis",
+        }
+        log_f.write(json.dumps(header) + "\n")
+
+        try:
+            for i, test_case in enumerate(TEST_CASES, 1):
+                print(f"\n{'=' * 80}")
+                print(f"🧪 RUNNING TEST CASE {i}: {test_case['name']}")
+                print(f"{'=' * 80}")
+
+                session_id = f"test_{i}_{test_case['name']}"
+                result = await run_single_test(test_case, session_id, agents)
+                result["test_name"] = test_case["name"]
+                log_f.write(json.dumps(result) + "\n")
+                log_f.flush()
+
+                print(f"\n✅ Test {i} Appeal Result:")
+                print(result["appeal_output"])
+
+        finally:
+            # Cleanup
+            for agent in agents:
+                await agent.cleanup_mcp_servers()
 
     print(f"\n{'=' * 80}")
     print("✅ ALL TESTS COMPLETED!")
-    print("📄 Full audit log saved to: demo_audit_log.json")
+    print("📄 Full audit log saved to: demo_audit_log.jsonl")
     print("📊 Use this file to showcase end-to-end capabilities to Avelis.")
     print(f"{'=' * 80}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -12,6 +12,15 @@ from typing import Optional, Dict
 # from omnicoreagent.omni_agent.workflow.parallel_agent import ParallelAgent
 import asyncio
 import uuid
+from types import MappingProxyType
+
+# Try importing uvloop (faster event loop; no Windows build)
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
 
 
 # Example tool: Google Search
@@ -28,13 +37,16 @@ def build_tool_registry_google_search() -> ToolRegistry:
 
 # --- Researcher Agents ---
 google_search_tool = build_tool_registry_google_search()
-GENERAL_MCP_TOOLS = [
-    {
-        "name": "tavily-remote-mcp",
-        "transport_type": "streamable_http",
-        "url": "https://mcp.tavily.com/mcp/?tavilyApiKey=<tavily api key>",
-    }
-]
+# Shared read-only across every researcher agent, so no agent can mutate it for the others
+GENERAL_MCP_TOOLS = (
+    MappingProxyType(
+        {
+            "name": "tavily-remote-mcp",
+            "transport_type": "streamable_http",
+            "url": "https://mcp.tavily.com/mcp/?tavilyApiKey=<tavily api key>",
+        }
+    ),
+)
 
 # Researcher 1: Renewable Energy
 renewable_energy_agent = OmniCoreAgent(
@@ -139,5 +151,8 @@ if __name__ == "__main__":
         "CarbonCaptureResearcher": "Provide key findings on carbon capture technologies",
     }
 
-    result = asyncio.run(run_parallel_researchers(agent_tasks=tasks))
+    if HAS_UVLOOP:
+        result = uvloop.run(run_parallel_researchers(agent_tasks=tasks))
+    else:
+        result = asyncio.run(run_parallel_researchers(agent_tasks=tasks))
     print("Parallel Researcher Results:", result)
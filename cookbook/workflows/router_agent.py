@@ -6,6 +6,7 @@ from omnicoreagent import (
     RouterAgent,
 )
 import asyncio
+from types import MappingProxyType
 
 # this is for low level import
 # from omnicoreagent.omni_agent.workflow.router_agent import RouterAgent
@@ -23,13 +24,16 @@ def build_tool_registry_google_search() -> ToolRegistry:
 
 
 # --- General MCP tools---
-GENERAL_MCP_TOOLS = [
-    {
-        "name": "tavily-remote-mcp",
-        "transport_type": "streamable_http",
-        "url": "https://mcp.tavily.com/mcp/?tavilyApiKey=<tavily api key>",
-    }
-]
+# Shared read-only across every researcher agent, so no agent can mutate it for the others
+GENERAL_MCP_TOOLS = (
+    MappingProxyType(
+        {
+            "name": "tavily-remote-mcp",
+            "transport_type": "streamable_http",
+            "url": "https://mcp.tavily.com/mcp/?tavilyApiKey=<tavily api key>",
+        }
+    ),
+)
 
 # --- Researcher OmniCoreAgents---
 renewable_energy_agent = OmniCoreAgent(
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """
-<<<<<<< HEAD
 Sequential Workflow Example: Content Generation Pipeline
 
 This example demonstrates a production-like sequential workflow for creating high-quality content.
@@ -11,27 +10,24 @@ The pipeline consists of three specialized agents:
 
 Prerequisites:
     - TAVILY_API_KEY environment variable must be set.
-    - Node.js (npx) installed for MCP tools.
-=======
-Sequential Workflow Example
-
-Chain multiple agents where output of one becomes input for the next.
-Example: Data Collector → Formatter → Reporter
->>>>>>> ee0f3ad (added cookbook getting started phase)
+    - Optional: `pip install orjson` for faster quality-report serialization.
+    - Optional: `pip install uvloop` for a faster event loop (not on Windows).
 
 Run:
     python cookbook/workflows/sequential_workflow.py
 """
 
 import asyncio
-<<<<<<< HEAD
+import functools
+import json
 import logging
 import os
+import re
 import sys
+import uuid
+from dataclasses import dataclass
 from typing import List, Optional
 
-=======
->>>>>>> ee0f3ad (added cookbook getting started phase)
 from dotenv import load_dotenv
 
 from omnicoreagent import (
@@ -42,7 +38,22 @@ from omnicoreagent import (
     EventRouter,
 )
 
-<<<<<<< HEAD
+# Try importing orjson (faster report serialization); fall back to json
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Try importing uvloop (faster event loop; no Windows build)
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -51,6 +62,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ContentPipeline")
 
+# Drafts scoring at least this need no further editing
+QUALITY_PASS_SCORE = 90
+
+# Shorter drafts (refusals, guardrail messages, empty responses) are never
+# treated as finished articles, however well they score
+MIN_DRAFT_WORDS = 150
+
+# Seconds main() waits for stage outputs still queued when the run returns
+STAGE_DRAIN_TIMEOUT = 5
+
+# Compiled once at import; the tools below run on every draft iteration
+_SENT_SPLIT_RE = re.compile(r"[.!?]+")
+
 
 def check_dependencies():
     """Verify all necessary dependencies and environment variables are present."""
@@ -62,11 +86,113 @@ def check_dependencies():
 
 def ensure_string(text: str | list) -> str:
     """Helper to ensure input is a string, handling lists from unpredictable LLM outputs."""
+    if type(text) is str:
+        return text
     if isinstance(text, list):
-        return " ".join(str(x) for x in text)
+        return " ".join(map(str, text))
     return str(text)
 
 
+# The tools below are pure functions of the draft text, and the Writer/Editor
+# often re-check an unchanged draft, so their reports are memoized on the text.
+@functools.lru_cache(maxsize=128)
+def _reading_time_report(text: str) -> str:
+    word_count = len(text.split())
+    minutes = max(1, round(word_count / 200))
+    return f"Estimated reading time: {minutes} minute(s) ({word_count} words)."
+
+
+@functools.lru_cache(maxsize=128)
+def _markdown_structure_report(text: str) -> str:
+    # A header is "#"/"##" plus a space at the start of a line, which plain
+    # substring checks answer without a regex scan of the whole draft
+    has_h1 = text.startswith("# ") or "\n# " in text
+    has_h2 = text.startswith("## ") or "\n## " in text
+
+    issues = []
+    if not has_h1:
+        issues.append("Missing main title (H1 '# Title').")
+    if not has_h2:
+        issues.append("Missing section headers (H2 '## Section').")
+
+    if not issues:
+        return "Structure check passed: H1 and H2 headers present."
+    return "Structure issues found:\n- " + "\n- ".join(issues)
+
+
+@functools.lru_cache(maxsize=128)
+def _content_quality_report(text: str) -> str:
+    # Tally counts while splitting instead of keeping stripped copies of
+    # every sentence/paragraph around for a second pass
+    word_count = len(text.split())
+
+    sentence_count = long_sentences = 0
+    for sentence in _SENT_SPLIT_RE.split(text):
+        if sentence and not sentence.isspace():
+            sentence_count += 1
+            # >25 words needs more than 50 chars; skip the split otherwise
+            if len(sentence) > 50 and len(sentence.split()) > 25:
+                long_sentences += 1
+
+    # Paragraphs are runs of non-blank lines; count their words line by line
+    # so no paragraph string is ever built
+    paragraph_count = long_paragraphs = 0
+    paragraph_words = 0
+    for line in text.splitlines():
+        if not line or line.isspace():
+            if paragraph_words:
+                paragraph_count += 1
+                long_paragraphs += paragraph_words > 150
+                paragraph_words = 0
+        else:
+            paragraph_words += len(line.split())
+    if paragraph_words:
+        paragraph_count += 1
+        long_paragraphs += paragraph_words > 150
+
+    avg_sentence_length = word_count / max(1, sentence_count)
+
+    score = 100
+    issues = []
+
+    if avg_sentence_length > 20:
+        score -= 10
+        issues.append("Average sentence length is too high (>20 words).")
+
+    if long_sentences:
+        score -= long_sentences * 2
+        issues.append(f"Found {long_sentences} complex sentences (>25 words).")
+
+    if long_paragraphs:
+        score -= long_paragraphs * 5
+        issues.append(f"Found {long_paragraphs} massive paragraphs (>150 words).")
+
+    report = {
+        "metrics": {
+            "word_count": word_count,
+            "sentence_count": sentence_count,
+            "paragraph_count": paragraph_count,
+            "avg_sentence_length": round(avg_sentence_length, 1),
+        },
+        "quality_score": max(0, score),
+        "passes": score >= QUALITY_PASS_SCORE,
+        "issues": issues,
+    }
+
+    if HAS_ORJSON:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(report, indent=2)
+
+
+def draft_passes(text: str) -> bool:
+    """Whether a draft is a full article that already meets QUALITY_PASS_SCORE."""
+    text = ensure_string(text)
+    if not text.strip():
+        return False
+    report = json.loads(_content_quality_report(text))
+    return report["metrics"]["word_count"] >= MIN_DRAFT_WORDS and report["passes"]
+
+
 def create_writer_tools() -> ToolRegistry:
     """Tools for the writer agent to self-check their draft."""
     registry = ToolRegistry()
@@ -74,29 +200,12 @@ def create_writer_tools() -> ToolRegistry:
     @registry.register_tool("estimate_reading_time")
     def estimate_reading_time(text: str | list) -> str:
         """Estimate reading time based on word count (approx 200 wpm)."""
-        text = ensure_string(text)
-        word_count = len(text.split())
-        minutes = max(1, round(word_count / 200))
-        return f"Estimated reading time: {minutes} minute(s) ({word_count} words)."
+        return _reading_time_report(ensure_string(text))
 
     @registry.register_tool("check_markdown_structure")
     def check_markdown_structure(text: str | list) -> str:
         """Check if the text has proper Markdown headers (H1, H2)."""
-        import re
-
-        text = ensure_string(text)
-        has_h1 = bool(re.search(r"^#\s+.+", text, re.MULTILINE))
-        has_h2 = bool(re.search(r"^##\s+.+", text, re.MULTILINE))
-
-        issues = []
-        if not has_h1:
-            issues.append("Missing main title (H1 '# Title').")
-        if not has_h2:
-            issues.append("Missing section headers (H2 '## Section').")
-
-        if not issues:
-            return "Structure check passed: H1 and H2 headers present."
-        return "Structure issues found:\n- " + "\n- ".join(issues)
+        return _markdown_structure_report(ensure_string(text))
 
     return registry
 
@@ -112,57 +221,57 @@ def create_editor_tools() -> ToolRegistry:
         - Word count and sentence length.
         - Identifies overly long sentences (>25 words).
         - Identifies huge paragraphs (>150 words).
-        Returns a structured JSON-like report.
+        Returns a structured JSON-like report; `passes` is true when the
+        quality score needs no further editing.
         """
-        import json
-        import re
+        return _content_quality_report(ensure_string(text))
 
-        text = ensure_string(text)
+    return registry
 
-        paragraphs = [p for p in text.split("\n\n") if p.strip()]
-        sentences = re.split(r"[.!?]+", text)
-        sentences = [s.strip() for s in sentences if s.strip()]
-        words = text.split()
 
-        avg_sentence_length = len(words) / max(1, len(sentences))
+async def print_stage_output(agent: OmniCoreAgent, session_id: str):
+    """Print an agent's final answer as soon as its pipeline stage completes."""
+    async for event in agent.stream_events(session_id):
+        if event.type == "final_answer":
+            print(f"\n--- {agent.name} output ---\n{event.payload.message}\n")
+            return
 
-        long_sentences = [s for s in sentences if len(s.split()) > 25]
-        long_paragraphs = [p for p in paragraphs if len(p.split()) > 150]
 
-        score = 100
-        issues = []
+@dataclass
+class ContentPipeline:
+    """Researcher -> Writer, then the Editor only when the draft needs it."""
 
-        if avg_sentence_length > 20:
-            score -= 10
-            issues.append("Average sentence length is too high (>20 words).")
+    drafting: SequentialAgent
+    editing: SequentialAgent
 
-        if long_sentences:
-            score -= len(long_sentences) * 2
-            issues.append(f"Found {len(long_sentences)} complex sentences (>25 words).")
+    @property
+    def sub_agents(self) -> List[OmniCoreAgent]:
+        return self.drafting.sub_agents + self.editing.sub_agents
 
-        if long_paragraphs:
-            score -= len(long_paragraphs) * 5
-            issues.append(
-                f"Found {len(long_paragraphs)} massive paragraphs (>150 words)."
-            )
+    async def initialize(self):
+        await asyncio.gather(self.drafting.initialize(), self.editing.initialize())
 
-        report = {
-            "metrics": {
-                "word_count": len(words),
-                "sentence_count": len(sentences),
-                "paragraph_count": len(paragraphs),
-                "avg_sentence_length": round(avg_sentence_length, 1),
-            },
-            "quality_score": max(0, score),
-            "issues": issues,
-        }
+    async def shutdown(self):
+        await asyncio.gather(self.drafting.shutdown(), self.editing.shutdown())
 
-        return json.dumps(report, indent=2)
+    async def run(self, initial_task: str, session_id: str) -> dict:
+        result = await self.drafting.run(
+            initial_task=initial_task, session_id=session_id
+        )
+        if "failed_agent" in result:
+            return result
 
-    return registry
+        # A passing draft would come back from the Editor unchanged, so skip
+        # the whole Editor generation instead of asking it to echo the draft
+        draft = result.get("response", "")
+        if draft_passes(draft):
+            logger.info("Draft passes the quality check; skipping the Editor.")
+            return {**result, "editor_skipped": True}
+
+        return await self.editing.run(initial_task=draft, session_id=session_id)
 
 
-async def create_pipeline() -> SequentialAgent:
+async def create_pipeline() -> ContentPipeline:
     """Initialize and configure the multi-agent pipeline."""
     tavily_api_key = os.getenv("TAVILY_API_KEY")
 
@@ -177,16 +286,13 @@ async def create_pipeline() -> SequentialAgent:
             "Summarize your findings clearly."
         ),
         model_config={"provider": "cencori", "model": "gpt-4o"},
+        # Talk to Tavily's remote MCP endpoint directly over HTTP rather than
+        # spawning an `npx mcp-remote` Node process to proxy it over stdio
         mcp_tools=[
             {
                 "name": "tavily-remote-mcp",
-                "transport_type": "stdio",
-                "command": "npx",
-                "args": [
-                    "-y",
-                    "mcp-remote",
-                    f"https://mcp.tavily.com/mcp/?tavilyApiKey={tavily_api_key}",
-                ],
+                "transport_type": "streamable_http",
+                "url": f"https://mcp.tavily.com/mcp/?tavilyApiKey={tavily_api_key}",
             }
         ],
         memory_router=MemoryRouter("in_memory"),
@@ -219,9 +325,9 @@ async def create_pipeline() -> SequentialAgent:
         system_instruction=(
             "You are a strict editor. Review the draft article. "
             "Use 'analyze_content_quality' to get a quantitative report on the text. "
-            "If the score is below 90, rewrite the low-quality sections to fix the reported issues "
-            "(e.g., shorten sentences, break up paragraphs). "
-            "Also ensure grammar and tone are perfect."
+            "If the report has `passes: true`, return the draft verbatim without rewriting it. "
+            "Otherwise, rewrite the low-quality sections to fix the reported issues "
+            "(e.g., shorten sentences, break up paragraphs) and ensure grammar and tone are perfect."
         ),
         model_config={"provider": "cencori", "model": "gpt-4o"},
         local_tools=create_editor_tools(),
@@ -230,108 +336,99 @@ async def create_pipeline() -> SequentialAgent:
         debug=True,
     )
 
-    return SequentialAgent(sub_agents=[researcher, writer, editor])
-=======
-
-def create_collector_tools() -> ToolRegistry:
-    """Tools for the data collector agent."""
-    registry = ToolRegistry()
-
-    @registry.register_tool("get_system_info")
-    def get_system_info() -> str:
-        """Get current system information."""
-        import platform
-        import time
-
-        return (
-            f"OS: {platform.system()} {platform.release()}\n"
-            f"Python: {platform.python_version()}\n"
-            f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}"
-        )
-
-    return registry
+    return ContentPipeline(
+        drafting=SequentialAgent(sub_agents=[researcher, writer]),
+        editing=SequentialAgent(sub_agents=[editor]),
+    )
 
 
-def create_formatter_tools() -> ToolRegistry:
-    """Tools for the text formatter agent."""
-    registry = ToolRegistry()
+# One pipeline per process: agents, HTTP clients and the MCP connection are
+# built on first use and reused by every later run until shutdown_pipeline()
+_pipeline: Optional[ContentPipeline] = None
+_pipeline_lock = asyncio.Lock()
 
-    @registry.register_tool("format_text")
-    def format_text(text: str, style: str = "uppercase") -> str:
-        """Format text in a specific style (uppercase, lowercase, title)."""
-        if style == "uppercase":
-            return text.upper()
-        elif style == "lowercase":
-            return text.lower()
-        elif style == "title":
-            return text.title()
-        return text
 
-    return registry
+async def get_pipeline() -> ContentPipeline:
+    """Return the shared pipeline, creating and initializing it on first use."""
+    global _pipeline
+    async with _pipeline_lock:
+        if _pipeline is None:
+            pipeline = await create_pipeline()
+            await pipeline.initialize()
+            logger.info("Workflow pipeline initialized.")
+            _pipeline = pipeline
+        return _pipeline
 
 
-# Agent 1: Collects data
-data_collector = OmniCoreAgent(
-    name="DataCollector",
-    system_instruction="Collect system information using the get_system_info tool.",
-    model_config={"provider": "openai", "model": "gpt-4o"},
-    local_tools=create_collector_tools(),
-    memory_router=MemoryRouter("in_memory"),
-    event_router=EventRouter("in_memory"),
-)
+async def shutdown_pipeline():
+    """Shut down the shared pipeline, if one was created."""
+    global _pipeline
+    async with _pipeline_lock:
+        if _pipeline is not None:
+            logger.info("Shutting down workflow...")
+            await _pipeline.shutdown()
+            _pipeline = None
+            logger.info("Shutdown complete.")
 
-# Agent 2: Formats the data
-text_formatter = OmniCoreAgent(
-    name="TextFormatter",
-    system_instruction="Format the input text to uppercase using the format_text tool.",
-    model_config={"provider": "openai", "model": "gpt-4o"},
-    local_tools=create_formatter_tools(),
-    memory_router=MemoryRouter("in_memory"),
-    event_router=EventRouter("in_memory"),
-)
 
-# Agent 3: Creates final report
-reporter = OmniCoreAgent(
-    name="Reporter",
-    system_instruction="Summarize the input into a brief final report.",
-    model_config={"provider": "openai", "model": "gpt-4o"},
-    memory_router=MemoryRouter("in_memory"),
-    event_router=EventRouter("in_memory"),
-)
+async def run_batch(topics: List[str], concurrency: int = 5) -> List[dict]:
+    """Run the pipeline once per topic, with at most `concurrency` runs in flight."""
+    workflow = await get_pipeline()
+    semaphore = asyncio.Semaphore(concurrency)
+    # The pipeline and its agents' memory outlive this call, so session ids
+    # must be unique per batch or topics would inherit an earlier run's history
+    batch_id = uuid.uuid4().hex
+
+    async def run_topic(idx: int, topic: str) -> dict:
+        async with semaphore:
+            logger.info(f"Starting workflow for topic: {topic}")
+            return await workflow.run(
+                initial_task=f"Research and write a comprehensive article about: {topic}",
+                session_id=f"content_batch_{batch_id}_{idx}",
+            )
 
-# Create the sequential workflow
-<<<<<<< HEAD
-workflow = SequentialAgent(
-    sub_agents=[data_collector, text_formatter, reporter]
-)
->>>>>>> ee0f3ad (added cookbook getting started phase)
-=======
-workflow = SequentialAgent(sub_agents=[data_collector, text_formatter, reporter])
->>>>>>> 5d48e69 (support cencori)
+    return await asyncio.gather(
+        *(run_topic(idx, topic) for idx, topic in enumerate(topics, start=1))
+    )
 
 
 async def main():
     load_dotenv()
-<<<<<<< HEAD
     check_dependencies()
 
-    workflow: Optional[SequentialAgent] = None
-
     try:
-        workflow = await create_pipeline()
-        await workflow.initialize()
-        logger.info("Workflow pipeline initialized.")
+        workflow = await get_pipeline()
 
         topic = "The Future of AI Agents in Software Development"
+        session_id = "prod_content_session_01"
         logger.info(f"Starting workflow for topic: {topic}")
 
+        # Show research and draft as soon as each stage finishes; the
+        # Editor's output, if it ran, is printed below as the final deliverable
+        stage_printers = [
+            asyncio.create_task(print_stage_output(agent, session_id))
+            for agent in workflow.sub_agents[:-1]
+        ]
+
         # Run the workflow
-        result = await workflow.run(
-            initial_task=f"Research and write a comprehensive article about: {topic}",
-            session_id="prod_content_session_01",
-        )
+        try:
+            result = await workflow.run(
+                initial_task=f"Research and write a comprehensive article about: {topic}",
+                session_id=session_id,
+            )
+            # Stage events are still queued when run() returns, so let the
+            # printers drain them; a stage that never answered is given up on
+            await asyncio.wait(stage_printers, timeout=STAGE_DRAIN_TIMEOUT)
+        finally:
+            for printer in stage_printers:
+                printer.cancel()
+            await asyncio.gather(*stage_printers, return_exceptions=True)
 
         logger.info("Workflow completed successfully.")
+        if result.get("editor_skipped"):
+            logger.info("The Writer's draft above is the final deliverable.")
+            return
+
         print("\n" + "#" * 50)
         print("FINAL DELIVERABLE")
         print("#" * 50 + "\n")
@@ -341,32 +438,11 @@ async def main():
     except Exception as e:
         logger.error(f"Workflow execution failed: {e}", exc_info=True)
     finally:
-        if workflow:
-            logger.info("Shutting down workflow...")
-            await workflow.shutdown()
-            logger.info("Shutdown complete.")
-=======
-
-    try:
-        # Initialize all agents
-        await workflow.initialize()
-        print("Workflow initialized!")
-
-        # Run the workflow
-        print("\nRunning sequential workflow...")
-        result = await workflow.run(
-            initial_task="Get system information and create a formatted report",
-            session_id="demo_session",
-        )
-
-        print(f"\nFinal Result:\n{result}")
-
-    finally:
-        # Clean up all agents
-        await workflow.shutdown()
-        print("\nWorkflow shut down.")
->>>>>>> ee0f3ad (added cookbook getting started phase)
+        await shutdown_pipeline()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if HAS_UVLOOP:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
@@ -1,11 +1,17 @@
+import functools
 import os
 
 
+@functools.lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> str:
+    # Only the first call for a path has to create it; later calls skip makedirs
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
 def get_output_dir() -> str:
     """Returns the absolute path to the outputs directory."""
-    output_dir = os.path.join(os.getcwd(), "outputs")
-    os.makedirs(output_dir, exist_ok=True)
-    return output_dir
+    return _ensure_dir(os.path.join(os.getcwd(), "outputs"))
 
 
 print(get_output_dir())
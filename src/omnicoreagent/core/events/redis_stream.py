@@ -4,6 +4,7 @@ from decouple import config
 from omnicoreagent.core.events.base import BaseEventStore, Event
 
 REDIS_URL = config("REDIS_URL", default="redis://localhost:6379/0")
+STREAM_READ_BATCH = 100
 
 
 class RedisStreamEventStore(BaseEventStore):
@@ -23,7 +24,10 @@ class RedisStreamEventStore(BaseEventStore):
         stream_name = f"omnicoreagent_events:{session_id}"
         last_id = "0-0"
         while True:
-            results = await self.redis.xread({stream_name: last_id}, block=0, count=1)
+            # Take whatever has piled up since the last read in one round trip
+            results = await self.redis.xread(
+                {stream_name: last_id}, block=0, count=STREAM_READ_BATCH
+            )
             if results:
                 _, entries = results[0]
                 for entry_id, data in entries:
@@ -7,9 +7,86 @@ import json
 from dataclasses import dataclass, field
 from datetime import datetime
 import hashlib
-from collections import defaultdict
+from collections import Counter, defaultdict
 import sys
 
+# Keywords counted by the heuristic stage. Both lists are tallied in a single
+# regex pass over the normalized input instead of one str.count per word.
+_RISK_WORDS = (
+    "ignore",
+    "disregard",
+    "system",
+    "prompt",
+    "reveal",
+    "instruction",
+    "override",
+    "bypass",
+    "admin",
+    "root",
+    "jailbreak",
+    "DAN",
+    "secret",
+    "hidden",
+    "unrestricted",
+)
+_INSTRUCTION_WORDS = ("ignore", "disregard", "override", "reveal", "show", "system")
+# Zero-width lookahead so a keyword starting inside the previous one (e.g.
+# "bypassystem") is still found; a plain alternation would consume it
+_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(map(re.escape, dict.fromkeys(_RISK_WORDS + _INSTRUCTION_WORDS)))
+    + "))"
+)
+
+
+def _count_keywords(text: str) -> Counter:
+    """Count each keyword in one pass, matching str.count() per keyword."""
+    counts = Counter()
+    next_start = {}
+    for match in _KEYWORD_RE.finditer(text):
+        word = match.group(1)
+        # str.count() does not count overlapping repeats of the same word
+        if match.start() >= next_start.get(word, 0):
+            counts[word] += 1
+            next_start[word] = match.start() + len(word)
+    return counts
+
+
+_SPECIAL_CHARS_RE = re.compile(r"[<>{}[\]\\|`~!@#$%^&*()+=]")
+# Context-boundary markers and escaped/encoded characters can never overlap,
+# so one alternation counts both kinds in a single pass
+_MARKER_RE = re.compile(
+    r"(?P<boundary>---|===|```|\*\*\*|\[system\]|<system>|</?prompt>)"
+    r"|(?P<encoding>\\x[0-9a-f]{2}|\\u[0-9a-f]{4}|&#\d+;|%[0-9a-f]{2})",
+    re.IGNORECASE,
+)
+
+# Leetspeak/lookalike characters folded back to letters, applied in one
+# str.translate pass rather than one str.replace per character
+_LEET_TABLE = str.maketrans(
+    {
+        "0": "o",
+        "1": "i",
+        "3": "e",
+        "4": "a",
+        "5": "s",
+        "7": "t",
+        "8": "b",
+        "@": "a",
+        "$": "s",
+        "!": "i",
+        "|": "i",
+        "€": "e",
+        "©": "c",
+        "®": "r",
+        "£": "e",
+        "¥": "y",
+        "¢": "c",
+        "µ": "u",
+        "°": "o",
+    }
+)
+
 
 class ThreatLevel(Enum):
     SAFE = "safe"
@@ -453,29 +530,7 @@ class DetectionEngine:
             r"[\u200b-\u200f\u202a-\u202e\u2060-\u206f\ufeff]", "", normalized
         )
 
-        leet_map = {
-            "0": "o",
-            "1": "i",
-            "3": "e",
-            "4": "a",
-            "5": "s",
-            "7": "t",
-            "8": "b",
-            "@": "a",
-            "$": "s",
-            "!": "i",
-            "|": "i",
-            "€": "e",
-            "©": "c",
-            "®": "r",
-            "£": "e",
-            "¥": "y",
-            "¢": "c",
-            "µ": "u",
-            "°": "o",
-        }
-        for leet, normal in leet_map.items():
-            normalized = normalized.replace(leet, normal)
+        normalized = normalized.translate(_LEET_TABLE)
 
         normalized = re.sub(
             r"([a-z])[\.\-_,;:\/\\]+([a-z])", r"\1 \2", normalized, flags=re.IGNORECASE
@@ -576,8 +631,7 @@ class DetectionEngine:
         if n == 0:
             return score, flags
 
-        special_chars = re.findall(r"[<>{}[\]\\|`~!@#$%^&*()+=]", original)
-        special_density = len(special_chars) / n
+        special_density = len(_SPECIAL_CHARS_RE.findall(original)) / n
         if special_density > 0.2:
             flags.append("very_high_delimiter_density")
             score += 8
@@ -587,13 +641,8 @@ class DetectionEngine:
         elif special_density > 0.1:
             score += 3
 
-        boundaries = len(
-            re.findall(
-                r"(?:---|===|```|\*\*\*|\[system\]|<system>|</?prompt>)",
-                original,
-                re.IGNORECASE,
-            )
-        )
+        marker_counts = Counter(m.lastgroup for m in _MARKER_RE.finditer(original))
+        boundaries = marker_counts["boundary"]
         if boundaries >= 4:
             flags.append("multiple_context_boundaries")
             score += 10
@@ -603,24 +652,8 @@ class DetectionEngine:
         elif boundaries >= 2:
             score += 4
 
-        risk_words = [
-            "ignore",
-            "disregard",
-            "system",
-            "prompt",
-            "reveal",
-            "instruction",
-            "override",
-            "bypass",
-            "admin",
-            "root",
-            "jailbreak",
-            "DAN",
-            "secret",
-            "hidden",
-            "unrestricted",
-        ]
-        risk_count = sum(normalized.count(w) for w in risk_words)
+        keyword_counts = _count_keywords(normalized)
+        risk_count = sum(keyword_counts[w] for w in _RISK_WORDS)
 
         if risk_count >= 5:
             flags.append("very_dense_attack_keywords")
@@ -632,13 +665,7 @@ class DetectionEngine:
             score += 5
 
         if self.config.enable_encoding_detection:
-            encoding_patterns = len(
-                re.findall(
-                    r"(?:\\x[0-9a-f]{2}|\\u[0-9a-f]{4}|&#\d+;|%[0-9a-f]{2})",
-                    original,
-                    re.IGNORECASE,
-                )
-            )
+            encoding_patterns = marker_counts["encoding"]
             if encoding_patterns >= 5:
                 flags.append("multiple_encoding_attempts")
                 score += 8
@@ -646,16 +673,8 @@ class DetectionEngine:
                 flags.append("encoding_detected")
                 score += 5
 
-        instruction_words = [
-            "ignore",
-            "disregard",
-            "override",
-            "reveal",
-            "show",
-            "system",
-        ]
         repeat_count = sum(
-            1 for word in instruction_words if normalized.count(word) >= 2
+            1 for word in _INSTRUCTION_WORDS if keyword_counts[word] >= 2
         )
         if repeat_count >= 3:
             flags.append("repetitive_injection_pattern")
@@ -683,24 +702,27 @@ class DetectionEngine:
         score = 0
         flags = []
 
-        lines = text.split("\n")
-        instruction_lines = []
+        # Lowercase the input once; the word counts below are unaffected
+        lines = text.lower().split("\n")
+        # Only "three or more" matters, so stop scanning at the third hit
+        instruction_lines = 0
 
-        for i, line in enumerate(lines):
-            line_lower = line.lower()
+        for line in lines:
             if any(
-                keyword in line_lower
+                keyword in line
                 for keyword in ["ignore", "disregard", "override", "system:", "prompt:"]
             ):
-                instruction_lines.append((i, line_lower))
+                instruction_lines += 1
+                if instruction_lines >= 3:
+                    break
 
-        if len(instruction_lines) >= 3:
+        if instruction_lines >= 3:
             flags.append("multiple_instruction_lines")
             score += 8
 
         if len(lines) >= 3:
             middle_index = len(lines) // 2
-            middle_line = lines[middle_index].lower()
+            middle_line = lines[middle_index]
             if any(
                 keyword in middle_line
                 for keyword in ["ignore", "disregard", "override"]
@@ -1,5 +1,6 @@
 import os
 from typing import Any
+import asyncio
 import time
 import random
 
@@ -105,6 +106,44 @@ def retry_with_backoff(max_retries=3, base_delay=1, max_delay=60, backoff_factor
     return decorator
 
 
+CENCORI_BASE_URL = "https://api.cencori.com/v1"
+
+# Cencori clients are shared by every LLMConnection using the same API key, so
+# agents reuse one HTTP connection pool instead of building a client (and a
+# fresh TLS session) per call. Async clients are kept per event loop because
+# their connection pools cannot be used from another loop.
+_cencori_clients: dict[str, openai.OpenAI] = {}
+_cencori_async_clients: dict[
+    asyncio.AbstractEventLoop, dict[str, openai.AsyncOpenAI]
+] = {}
+
+
+def _get_cencori_client(api_key: str) -> openai.OpenAI:
+    client = _cencori_clients.get(api_key)
+    if client is None:
+        client = openai.OpenAI(base_url=CENCORI_BASE_URL, api_key=api_key)
+        _cencori_clients[api_key] = client
+    return client
+
+
+def _get_cencori_async_client(api_key: str) -> openai.AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    # A client's pooled connections reference the loop they were opened on,
+    # so entries never expire on their own. Drop those of finished loops; they
+    # cannot be aclose()d without their loop, and dropping them lets their
+    # sockets be released instead of staying pinned here.
+    for dead_loop in [lp for lp in _cencori_async_clients if lp.is_closed()]:
+        del _cencori_async_clients[dead_loop]
+    loop_clients = _cencori_async_clients.get(loop)
+    if loop_clients is None:
+        loop_clients = _cencori_async_clients[loop] = {}
+    client = loop_clients.get(api_key)
+    if client is None:
+        client = openai.AsyncOpenAI(base_url=CENCORI_BASE_URL, api_key=api_key)
+        loop_clients[api_key] = client
+    return client
+
+
 class LLMConnection:
     """Manages LLM connections using LiteLLM."""
 
@@ -305,10 +344,7 @@ class LLMConnection:
             litellm.drop_params = True
 
             if self.llm_config["provider"].lower() == "cencori":
-                client = openai.AsyncOpenAI(
-                    base_url="https://api.cencori.com/v1",
-                    api_key=self.config.llm_api_key,
-                )
+                client = _get_cencori_async_client(self.config.llm_api_key)
 
                 model_name = self.llm_config["model"]
 
@@ -379,10 +415,7 @@ class LLMConnection:
             litellm.drop_params = True
 
             if self.llm_config["provider"].lower() == "cencori":
-                client = openai.OpenAI(
-                    base_url="https://api.cencori.com/v1",
-                    api_key=self.config.llm_api_key,
-                )
+                client = _get_cencori_client(self.config.llm_api_key)
 
                 model_name = self.llm_config["model"]
 
@@ -1,6 +1,6 @@
 import json
 import uuid
-from typing import Any, List, Callable
+from typing import Any, AsyncIterator, List, Callable, Tuple
 import redis.asyncio as redis
 from decouple import config
 import threading
@@ -16,6 +16,7 @@ from omnicoreagent.core.summarizer.summarizer_types import SummaryConfig
 from datetime import datetime, timezone
 
 REDIS_URL = config("REDIS_URL", default=None)
+ZRANGE_BATCH = 100
 
 
 class RedisConnectionManager:
@@ -140,6 +141,24 @@ class RedisMemoryStore(AbstractMemoryStore):
             keys.append(key)
         return keys
 
+    async def _zrange_many(
+        self, client: redis.Redis, keys: List[str], withscores: bool = False
+    ) -> AsyncIterator[Tuple[str, list]]:
+        """Yield (key, members) for every given sorted set, read in full.
+
+        Keys are pipelined ZRANGE_BATCH at a time and each batch is handed to
+        the caller before the next is read, so only one batch of sessions is
+        held in memory however large the store is.
+        """
+        for start in range(0, len(keys), ZRANGE_BATCH):
+            batch = keys[start : start + ZRANGE_BATCH]
+            async with client.pipeline(transaction=False) as pipe:
+                for key in batch:
+                    pipe.zrange(key, 0, -1, withscores=withscores)
+                results = await pipe.execute()
+            for item in zip(batch, results):
+                yield item
+
     def set_memory_config(
         self,
         mode: str,
@@ -389,8 +408,7 @@ class RedisMemoryStore(AbstractMemoryStore):
 
         total_removed = 0
 
-        for key in keys:
-            messages = await client.zrange(key, 0, -1)
+        async for key, messages in self._zrange_many(client, keys):
             if not messages:
                 continue
 
@@ -461,8 +479,9 @@ class RedisMemoryStore(AbstractMemoryStore):
             pattern = "omnicoreagent_memory:*"
             keys = await self._scan_keys(client, pattern)
 
-            for key in keys:
-                raw_messages = await client.zrange(key, 0, -1, withscores=True)
+            async for key, raw_messages in self._zrange_many(
+                client, keys, withscores=True
+            ):
                 if not raw_messages:
                     continue
 
@@ -5,7 +5,16 @@ import uuid
 import threading
 import asyncio
 from omnicoreagent.core.memory_store.base import AbstractMemoryStore
-from sqlalchemy import String, Text, DateTime, create_engine, func, inspect, text
+from sqlalchemy import (
+    String,
+    Text,
+    DateTime,
+    Index,
+    create_engine,
+    func,
+    inspect,
+    text,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, sessionmaker
 from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.mutable import MutableDict
@@ -144,6 +153,13 @@ class Base(DeclarativeBase):
 
 class StorageMessage(Base):
     __tablename__ = "messages"
+    # Covers get_messages: active messages of one session in timestamp order
+    __table_args__ = (
+        Index(
+            "ix_messages_session_status_timestamp", "session_id", "status", "timestamp"
+        ),
+    )
+
     id: Mapped[str] = mapped_column(
         String(DEFAULT_MAX_KEY_LENGTH),
         primary_key=True,
@@ -198,6 +214,7 @@ class DatabaseMessageStore(AbstractMemoryStore):
                 Base.metadata.create_all(db_engine)
             else:
                 self._migrate_add_columns(db_engine, inspector)
+                self._migrate_add_indexes(db_engine)
 
             logger.debug(f"DatabaseMessageStore initialized with: {db_url}")
         else:
@@ -246,6 +263,17 @@ class DatabaseMessageStore(AbstractMemoryStore):
                     except Exception as e:
                         logger.debug(f"Column '{col_name}' may already exist: {e}")
 
+    def _migrate_add_indexes(self, db_engine):
+        """
+        Auto-migrate: create indexes missing from databases made before they
+        were added to the model.
+        """
+        for index in StorageMessage.__table__.indexes:
+            try:
+                index.create(db_engine, checkfirst=True)
+            except Exception as e:
+                logger.debug(f"Index '{index.name}' could not be created: {e}")
+
     def _get_session(self, fresh_for_background: bool = False):
         """Get a database session from the connection manager."""
         if self._sql_manager is None:
@@ -5,6 +5,15 @@ from typing import Any, Dict, List
 
 
 class Tool:
+    __slots__ = (
+        "name",
+        "description",
+        "inputSchema",
+        "function",
+        "is_async",
+        "_params",
+    )
+
     def __init__(
         self,
         name: str,
@@ -17,6 +26,11 @@ class Tool:
         self.inputSchema = inputSchema
         self.function = function
         self.is_async = asyncio.iscoroutinefunction(function)
+        # Resolve the signature once; execute() runs on every tool call
+        self._params = tuple(
+            (param_name, param.default)
+            for param_name, param in inspect.signature(function).parameters.items()
+        )
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -28,14 +42,13 @@ class Tool:
 
     async def execute(self, parameters: Dict[str, Any]) -> Any:
         """Execute the tool with extracted parameters"""
-        sig = inspect.signature(self.function)
         func_params = {}
 
-        for param_name, param in sig.parameters.items():
+        for param_name, default in self._params:
             if param_name in parameters:
                 func_params[param_name] = parameters[param_name]
-            elif param.default is not inspect.Parameter.empty:
-                func_params[param_name] = param.default
+            elif default is not inspect.Parameter.empty:
+                func_params[param_name] = default
             else:
                 raise ValueError(f"Missing required parameter: {param_name}")
 
@@ -223,11 +223,10 @@ class OmniCoreAgent:
         if max_tokens:
             instruction += f" Keep the summary roughly under {max_tokens} tokens."
 
-        history_text = ""
-        for msg in messages:
-            role = msg.get("role", "unknown")
-            content = msg.get("content", "")
-            history_text += f"{role}: {content}\n"
+        history_text = "".join(
+            f"{msg.get('role', 'unknown')}: {msg.get('content', '')}\n"
+            for msg in messages
+        )
 
         prompt_messages = [
             {
@@ -295,24 +295,15 @@ class BackgroundAgentManager:
 
     async def get_manager_status(self) -> Dict[str, Any]:
         """Get overall manager status."""
-        agent_statuses = {}
-        running_count = 0
-        paused_count = 0
-
-        for agent_id in self.agents:
-            status = await self.get_agent_status(agent_id)
-            if status:
-                agent_statuses[agent_id] = status
-                if status.get("is_running"):
-                    running_count += 1
-                else:
-                    paused_count += 1
+        # Only the running flag is needed here; building each agent's full
+        # status (tools, event stream, task query) just to count it is wasted
+        running_count = sum(1 for agent in self.agents.values() if agent.is_running)
 
         return {
             "manager_running": self.is_running,
             "total_agents": len(self.agents),
             "running_agents": running_count,
-            "paused_agents": paused_count,
+            "paused_agents": len(self.agents) - running_count,
             "agents": list(self.agents.keys()),
             "total_tasks": len(self.task_registry.get_agent_ids()),
             "registered_tasks": self.task_registry.get_agent_ids(),
@@ -1,4 +1,5 @@
 import json
+from collections.abc import Mapping
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass, asdict, field
 from enum import Enum
@@ -164,12 +165,12 @@ class ConfigTransformer:
         self, config: Union[Dict[str, Any], MCPToolConfig]
     ) -> MCPToolConfig:
         """Ensure tool config is an MCPToolConfig instance"""
-        if isinstance(config, dict):
+        if isinstance(config, Mapping):
             return MCPToolConfig(**config)
         elif isinstance(config, MCPToolConfig):
             return config
         else:
-            raise ValueError("mcp_tools must contain dict or MCPToolConfig")
+            raise ValueError("mcp_tools must contain mapping or MCPToolConfig")
 
     def _ensure_agent_config(
         self, config: Union[Dict[str, Any], AgentConfig]
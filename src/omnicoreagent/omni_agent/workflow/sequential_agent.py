@@ -1,6 +1,7 @@
 from omnicoreagent.omni_agent.agent import OmniCoreAgent
 from typing import List, Optional
 from omnicoreagent.core.utils import logger
+import asyncio
 import uuid
 
 
@@ -17,19 +18,28 @@ class SequentialAgent:
         self._initialized = False
 
     async def initialize(self):
-        """Connect MCP servers for all sub-agents."""
+        """Connect MCP servers for all sub-agents concurrently."""
         if self._initialized:
             return
         logger.info("SequentialAgent: Initializing MCP servers for sub-agents")
-        for agent in self.sub_agents:
-            if getattr(agent, "mcp_tools", None):
-                try:
-                    await agent.connect_mcp_servers()
-                    logger.info(f"{agent.name}: MCP servers connected")
-                except Exception as exc:
-                    logger.warning(f"{agent.name}: MCP connection failed: {exc}")
+        # Connections are independent of run order, so bring them up together
+        await asyncio.gather(
+            *(
+                self._connect_agent(agent)
+                for agent in self.sub_agents
+                if getattr(agent, "mcp_tools", None)
+            )
+        )
         self._initialized = True
 
+    @staticmethod
+    async def _connect_agent(agent: OmniCoreAgent):
+        try:
+            await agent.connect_mcp_servers()
+            logger.info(f"{agent.name}: MCP servers connected")
+        except Exception as exc:
+            logger.warning(f"{agent.name}: MCP connection failed: {exc}")
+
     async def run(self, initial_task: str = None, session_id: str = None) -> dict:
         if not self._initialized:
             raise RuntimeError(
@@ -95,10 +105,18 @@ class SequentialAgent:
                 await self.shutdown()
 
     async def shutdown(self):
-        for agent in self.sub_agents:
-            if getattr(agent, "mcp_tools", None):
-                try:
-                    await agent.cleanup()
-                    logger.info(f"{agent.name}: MCP cleanup successful")
-                except Exception as exc:
-                    logger.warning(f"{agent.name}: MCP cleanup failed: {exc}")
+        await asyncio.gather(
+            *(
+                self._cleanup_agent(agent)
+                for agent in self.sub_agents
+                if getattr(agent, "mcp_tools", None)
+            )
+        )
+
+    @staticmethod
+    async def _cleanup_agent(agent: OmniCoreAgent):
+        try:
+            await agent.cleanup()
+            logger.info(f"{agent.name}: MCP cleanup successful")
+        except Exception as exc:
+            logger.warning(f"{agent.name}: MCP cleanup failed: {exc}")
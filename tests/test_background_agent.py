@@ -429,3 +429,25 @@ class TestBackgroundAgentManager:
         status = await manager.get_manager_status()
         assert status["total_agents"] == 1
         assert "test_agent" in status["agents"]
+        assert status["running_agents"] + status["paused_agents"] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_manager_status_counts_running_agents(self, mock_omni_agent):
+        manager = BackgroundAgentManager()
+        for agent_id in ("agent_a", "agent_b"):
+            await manager.create_agent(
+                {
+                    "agent_id": agent_id,
+                    "task_config": {"query": "task", "interval": 60},
+                    "model_config": {"provider": "openai", "model": "gpt-4"},
+                }
+            )
+        manager.agents["agent_a"].is_running = True
+        manager.agents["agent_b"].is_running = False
+
+        with patch.object(manager, "get_agent_status") as mock_agent_status:
+            status = await manager.get_manager_status()
+
+        mock_agent_status.assert_not_called()
+        assert status["running_agents"] == 1
+        assert status["paused_agents"] == 1
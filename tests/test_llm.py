@@ -1,5 +1,7 @@
+import asyncio
 from unittest.mock import Mock, patch, AsyncMock
 import pytest
+from omnicoreagent.core import llm
 from omnicoreagent.core.llm import LLMConnection
 
 
@@ -93,3 +95,62 @@ class TestLLMConnection:
 
     def test_removed_method_is_not_present(self, mock_llm_connection):
         assert not hasattr(mock_llm_connection, "truncate_messages_for_groq")
+
+    @pytest.mark.asyncio
+    async def test_cencori_client_shared_across_connections(self):
+        messages = [{"role": "user", "content": "What is AI?"}]
+
+        with patch("omnicoreagent.core.llm.openai.AsyncOpenAI") as mock_client_cls:
+            mock_client = Mock()
+            mock_client.chat.completions.create = AsyncMock(
+                return_value={"mocked": "response"}
+            )
+            mock_client_cls.return_value = mock_client
+
+            conn1 = LLMConnection(
+                Mock(**make_mock_config("cencori", "gpt-4o")), "test_config.yaml"
+            )
+            conn2 = LLMConnection(
+                Mock(**make_mock_config("cencori", "gpt-4o")), "test_config.yaml"
+            )
+
+            assert await conn1.llm_call(messages) == {"mocked": "response"}
+            assert await conn1.llm_call(messages) == {"mocked": "response"}
+            assert await conn2.llm_call(messages) == {"mocked": "response"}
+
+            mock_client_cls.assert_called_once()
+            assert mock_client.chat.completions.create.await_count == 3
+
+    def test_cencori_clients_of_finished_loops_are_dropped(self):
+        messages = [{"role": "user", "content": "What is AI?"}]
+
+        def make_client(**kwargs):
+            client = Mock()
+            client.chat.completions.create = AsyncMock(
+                return_value={"mocked": "response"}
+            )
+            # Like httpx's pooled connections, the client pins its loop
+            client.loop = asyncio.get_running_loop()
+            return client
+
+        async def run_once(conn):
+            assert await conn.llm_call(messages) == {"mocked": "response"}
+            # Only the running loop may still have clients cached
+            assert list(llm._cencori_async_clients) == [asyncio.get_running_loop()]
+            return llm._cencori_async_clients[asyncio.get_running_loop()]
+
+        with (
+            patch(
+                "omnicoreagent.core.llm.openai.AsyncOpenAI", side_effect=make_client
+            ) as mock_client_cls,
+            patch.dict(llm._cencori_async_clients, clear=True),
+        ):
+            conn = LLMConnection(
+                Mock(**make_mock_config("cencori", "gpt-4o")), "test_config.yaml"
+            )
+            seen = [asyncio.run(run_once(conn)) for _ in range(3)]
+
+            # Each loop got its own client; none outlived its loop's next lookup
+            assert mock_client_cls.call_count == 3
+            assert len({id(clients["test-api-key"]) for clients in seen}) == 3
+            assert len(llm._cencori_async_clients) == 1
@@ -0,0 +1,51 @@
+"""
+Tests for the local tools registry.
+"""
+
+import pytest
+
+from omnicoreagent.core.tools.local_tools_registry import ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = ToolRegistry()
+
+    @registry.register_tool("add")
+    def add(a: int, b: int = 2) -> int:
+        """Add two numbers."""
+        return a + b
+
+    @registry.register_tool("greet")
+    async def greet(name: str) -> str:
+        """Greet someone."""
+        return f"Hello, {name}"
+
+    return registry
+
+
+class TestToolExecution:
+    """Tests for executing registered tools."""
+
+    @pytest.mark.asyncio
+    async def test_sync_tool_uses_defaults(self, registry):
+        assert await registry.execute_tool("add", {"a": 1}) == 3
+        assert await registry.execute_tool("add", {"a": 1, "b": 5}) == 6
+
+    @pytest.mark.asyncio
+    async def test_async_tool(self, registry):
+        assert await registry.execute_tool("greet", {"name": "Ada"}) == "Hello, Ada"
+
+    @pytest.mark.asyncio
+    async def test_extra_parameters_are_ignored(self, registry):
+        assert await registry.execute_tool("add", {"a": 1, "c": 9}) == 3
+
+    @pytest.mark.asyncio
+    async def test_missing_required_parameter(self, registry):
+        with pytest.raises(ValueError, match="Missing required parameter: a"):
+            await registry.execute_tool("add", {"b": 1})
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, registry):
+        with pytest.raises(ValueError, match="not found"):
+            await registry.execute_tool("missing", {})
@@ -0,0 +1,117 @@
+"""
+Tests for the Redis memory store's cross-session scans, against a small
+in-process stand-in for the redis.asyncio client.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from omnicoreagent.core.memory_store import redis_memory
+from omnicoreagent.core.memory_store.redis_memory import RedisMemoryStore
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.ops = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def zrange(self, key, start, end, withscores=False):
+        self.ops.append(("zrange", key, withscores))
+
+    def zrem(self, key, member):
+        self.ops.append(("zrem", key, member))
+
+    def zadd(self, key, mapping):
+        self.ops.append(("zadd", key, mapping))
+
+    async def execute(self):
+        self.client.executed.append([op[0] for op in self.ops])
+        results = []
+        for op, key, arg in self.ops:
+            zset = self.client.data.setdefault(key, {})
+            if op == "zrange":
+                members = sorted(zset.items(), key=lambda item: item[1])
+                results.append(members if arg else [m for m, _ in members])
+            elif op == "zrem":
+                results.append(int(zset.pop(arg, None) is not None))
+            else:
+                zset.update(arg)
+                results.append(len(arg))
+        return results
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+        self.executed = []
+
+    async def scan_iter(self, match=None):
+        prefix = match.rstrip("*")
+        for key in list(self.data):
+            if key.startswith(prefix):
+                yield key
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+def _message(msg_id, agent_name):
+    return json.dumps(
+        {"id": msg_id, "content": "hi", "msg_metadata": {"agent_name": agent_name}}
+    )
+
+
+@pytest.fixture
+def client():
+    client = FakeRedis()
+    for session in range(250):
+        client.data[f"omnicoreagent_memory:s{session}"] = {
+            _message(f"a{session}", "agent_a"): 1.0,
+            _message(f"b{session}", "agent_b"): 2.0,
+        }
+    return client
+
+
+@pytest.fixture
+def store(client):
+    store = RedisMemoryStore(redis_url="redis://localhost:6379")
+    manager = MagicMock()
+    manager.get_client = AsyncMock(return_value=client)
+    store._connection_manager = manager
+    return store
+
+
+def _zrange_batch_sizes(client):
+    return [ops.count("zrange") for ops in client.executed if "zrange" in ops]
+
+
+@pytest.mark.asyncio
+async def test_clear_agent_across_sessions_reads_in_batches(store, client):
+    await store.clear_memory(agent_name="agent_a")
+
+    assert _zrange_batch_sizes(client) == [redis_memory.ZRANGE_BATCH] * 2 + [50]
+    for zset in client.data.values():
+        assert [json.loads(m)["msg_metadata"]["agent_name"] for m in zset] == [
+            "agent_b"
+        ]
+
+
+@pytest.mark.asyncio
+async def test_mark_messages_summarized_reads_in_batches(store, client):
+    await store.mark_messages_summarized(["a0", "a249"], summary_id="sum")
+
+    assert _zrange_batch_sizes(client) == [redis_memory.ZRANGE_BATCH] * 2 + [50]
+    for key, msg_id in (("s0", "a0"), ("s249", "a249")):
+        zset = client.data[f"omnicoreagent_memory:{key}"]
+        updated = next(json.loads(m) for m in zset if json.loads(m)["id"] == msg_id)
+        assert updated["status"] == "inactive"
+        assert updated["summary_id"] == "sum"
+        assert zset[json.dumps(updated)] == 1.0
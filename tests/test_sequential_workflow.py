@@ -0,0 +1,77 @@
+"""
+Tests for the content pipeline in the sequential workflow cookbook example.
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+_MODULE_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "cookbook"
+    / "workflows"
+    / "sequential_workflow.py"
+)
+_spec = importlib.util.spec_from_file_location("sequential_workflow", _MODULE_PATH)
+sequential_workflow = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(sequential_workflow)
+
+GOOD_DRAFT = "\n\n".join(
+    ["# Title"]
+    + ["AI agents now review code before it ships. They catch bugs early."] * 20
+)
+
+
+def _pipeline(draft):
+    drafting = MagicMock()
+    drafting.run = AsyncMock(return_value={"response": draft})
+    editing = MagicMock()
+    editing.run = AsyncMock(return_value={"response": "edited"})
+    return sequential_workflow.ContentPipeline(drafting=drafting, editing=editing)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "draft", ["", "   ", "I'm sorry, but I can't help with that request."]
+)
+async def test_empty_or_trivial_draft_goes_to_editor(draft):
+    pipeline = _pipeline(draft)
+
+    result = await pipeline.run(initial_task="topic", session_id="s1")
+
+    pipeline.editing.run.assert_awaited_once_with(initial_task=draft, session_id="s1")
+    assert result == {"response": "edited"}
+
+
+@pytest.mark.asyncio
+async def test_passing_draft_skips_editor():
+    assert sequential_workflow.draft_passes(GOOD_DRAFT)
+    pipeline = _pipeline(GOOD_DRAFT)
+
+    result = await pipeline.run(initial_task="topic", session_id="s1")
+
+    pipeline.editing.run.assert_not_awaited()
+    assert result == {"response": GOOD_DRAFT, "editor_skipped": True}
+
+
+@pytest.mark.asyncio
+async def test_stage_printer_stops_after_final_answer(capsys):
+    async def stream_events(session_id):
+        for event_type, message in [
+            ("tool_call", "search"),
+            ("final_answer", "draft"),
+            ("final_answer", "never read"),
+        ]:
+            yield MagicMock(type=event_type, payload=MagicMock(message=message))
+
+    agent = MagicMock()
+    agent.name = "Writer"
+    agent.stream_events = stream_events
+
+    await sequential_workflow.print_stage_output(agent, "s1")
+
+    out = capsys.readouterr().out
+    assert "--- Writer output ---\ndraft" in out
+    assert "never read" not in out
@@ -0,0 +1,63 @@
+"""
+Tests for the SQL-backed message store schema.
+"""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from omnicoreagent.core.memory_store.sql_db_memory import (
+    DatabaseMessageStore,
+    get_sql_manager,
+)
+
+INDEX_NAME = "ix_messages_session_status_timestamp"
+
+
+@pytest.fixture(autouse=True)
+def reset_sql_manager():
+    get_sql_manager().close_all()
+    yield
+    get_sql_manager().close_all()
+
+
+def _index_names(db_url):
+    engine = create_engine(db_url)
+    try:
+        return {index["name"] for index in inspect(engine).get_indexes("messages")}
+    finally:
+        engine.dispose()
+
+
+def test_new_database_gets_session_index(tmp_path):
+    db_url = f"sqlite:///{tmp_path}/new.db"
+    DatabaseMessageStore(db_url=db_url)
+    assert INDEX_NAME in _index_names(db_url)
+
+
+def test_existing_database_is_migrated_to_session_index(tmp_path):
+    db_url = f"sqlite:///{tmp_path}/old.db"
+    engine = create_engine(db_url)
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "CREATE TABLE messages (id VARCHAR(128) PRIMARY KEY, "
+                "session_id VARCHAR(128), role VARCHAR(256), content TEXT, "
+                "created_at DATETIME, timestamp VARCHAR(50), msg_metadata TEXT)"
+            )
+        )
+    engine.dispose()
+
+    DatabaseMessageStore(db_url=db_url)
+    assert INDEX_NAME in _index_names(db_url)
+
+
+@pytest.mark.asyncio
+async def test_get_messages_filters_by_session(tmp_path):
+    store = DatabaseMessageStore(db_url=f"sqlite:///{tmp_path}/messages.db")
+    store.set_memory_config("sliding_window", 10)
+    await store.store_message("user", "first", {"agent_name": "a"}, "s1")
+    await store.store_message("user", "other", {"agent_name": "a"}, "s2")
+    await store.store_message("assistant", "second", {"agent_name": "a"}, "s1")
+
+    messages = await store.get_messages("s1")
+    assert [m["content"] for m in messages] == ["first", "second"]